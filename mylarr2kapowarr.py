@@ -8,47 +8,485 @@ calls the Kapowarr API to add the corresponding comic volumes and copy files to
 """
 
 import argparse
+import contextlib
+import filecmp
+import hashlib
+import itertools
 import json
 import logging
 import os
-import re
 import shutil
+import stat
+import sys
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from email.message import Message
 import requests
-from typing import Dict, List, Optional, Tuple, Any, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Any, Union
+
+# fcntl is POSIX-only; it is used to request copy-on-write clones on Linux
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional - it parses large API responses much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional - it lets large responses be parsed without loading them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Root folder paths inside the Mylar and Kapowarr containers
+MYLAR_CONTAINER_PREFIX = "/comics/"
+KAPOWARR_CONTAINER_PREFIX = "/comics-1/"
+
+# Number of issues downloaded from Mylar at the same time for each comic
+DOWNLOAD_WORKERS = 4
+
+# (connect, read) timeout in seconds for issue downloads
+DOWNLOAD_TIMEOUT = (5, 60)
+
+# Maximum number of getComic results kept in memory (and prefetched) at once
+COMIC_INFO_CACHE_SIZE = 32
+
+# ioctl request number for cloning a file (Linux FICLONE)
+_FICLONE = 0x40049409
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("mylar2kapowarr")
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _map_path_prefix(path: str, rules: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """
+    Rewrite the leading prefix of a path using the first matching (prefix, replacement) rule.
+    
+    Returns:
+        The rewritten path, or None if no rule matches
+    """
+    for prefix, replacement in rules:
+        if path.startswith(prefix):
+            return replacement + path[len(prefix):]
+    return None
+
+
+# Directories already created by _ensure_dir during this run
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per run, skipping the syscall for known directories."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist or cannot be read."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _files_equivalent(
+    src_path: str,
+    src_stat: os.stat_result,
+    dst_path: str,
+    sample_size: int = 64 * 1024
+) -> bool:
+    """
+    Check whether two files have the same content.
+    
+    Files with the same size and modification time are taken to be the same,
+    as _clone_or_copy keeps the source's mtime on every copy it makes. Otherwise
+    the first and last sample_size bytes are compared, so different issues are
+    usually told apart without reading them whole, and only files that pass
+    those checks are compared in full.
+    """
+    src_size = src_stat.st_size
+    dst_stat = _stat_or_none(dst_path)
+    if dst_stat is None or dst_stat.st_size != src_size:
+        return False
+    if dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+        return True
+    
+    try:
+        with open(src_path, 'rb') as src, open(dst_path, 'rb') as dst:
+            if src.read(sample_size) != dst.read(sample_size):
+                return False
+            if src_size > sample_size:
+                tail_offset = max(src_size - sample_size, sample_size)
+                src.seek(tail_offset)
+                dst.seek(tail_offset)
+                if src.read(sample_size) != dst.read(sample_size):
+                    return False
+        return filecmp.cmp(src_path, dst_path, shallow=False)
+    except OSError:
+        return False
+
+
+def _clone_or_copy(src_path: str, dst_path: str) -> None:
+    """
+    Copy a file with its metadata like shutil.copy2, cloning it instead when the
+    filesystem supports reflinks (Btrfs, XFS) so no data has to be copied at all.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(src_path, dst_path)
+            return
+        except OSError:
+            # Different filesystems or no reflink support - fall back to a regular copy
+            pass
+    shutil.copy2(src_path, dst_path)
+
+
+def _content_disposition_filename(content_disposition: Optional[str]) -> str:
+    """
+    Get the filename from a Content-Disposition header.
+    
+    The email header parser handles quoted, unquoted and RFC 5987 filename*=
+    values. Any directory part is dropped so the file can't be written
+    outside the destination folder.
+    
+    Returns:
+        The bare filename, or empty string if the header has none
+    """
+    if not content_disposition:
+        return ""
+    header = Message()
+    header["Content-Disposition"] = content_disposition
+    filename = os.path.basename((header.get_filename() or "").replace("\\", "/"))
+    return "" if filename in (".", "..") else filename
+
+
+def _save_response_body(response: requests.Response, file_path: str) -> None:
+    """
+    Save a streamed response body to file_path.
+    
+    The copy runs in shutil's C-level loop with 1 MiB buffers instead of
+    iterating over small chunks in Python. The body is written to a .part
+    file first and renamed into place once complete, so an interrupted
+    download never leaves a truncated file behind under the real name.
+    """
+    part_path = f"{file_path}.part"
+    try:
+        with open(part_path, 'wb') as f:
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+        os.replace(part_path, file_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a requests session with a larger keep-alive connection pool
+    and retries on transient gateway errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _TeeReader:
+    """File-like wrapper that copies everything read from a stream into a sink file."""
+
+    def __init__(self, stream, sink):
+        self.stream = stream
+        self.sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.sink.write(data)
+        return data
+
+
+def _iter_data_items(stream, shape: Dict) -> Iterator[Any]:
+    """
+    Stream-parse the items of the top-level "data" array of an API response.
+    
+    shape["data"] is set to the event that opened "data" ("start_array" or
+    "start_map"), so callers can tell an empty list apart from a response
+    with a different structure.
+    """
+    def _watch(events):
+        for prefix, event, value in events:
+            if prefix == "data" and event in ("start_array", "start_map"):
+                shape["data"] = event
+            yield prefix, event, value
+    
+    return ijson.items(_watch(ijson.parse(stream)), "data.item")
+
+
+class ResponseCache:
+    """
+    On-disk cache of API response bodies, revalidated with ETag / If-None-Match
+    so unchanged responses can be served locally after a 304 Not Modified.
+    A disabled cache sends plain requests and stores nothing.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: bool = True):
+        if cache_dir is None:
+            cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            cache_dir = os.path.join(cache_root, "mylar2kapowarr")
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+
+    def body_path(self, key: str) -> str:
+        """Get the path of the cached response body for a request key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get_etag(self, key: str) -> Optional[str]:
+        """Get the ETag of the cached response, or None if nothing is cached."""
+        if not self.enabled:
+            return None
+        body_path = self.body_path(key)
+        try:
+            with open(f"{body_path}.etag", 'r') as f:
+                etag = f.read().strip()
+        except OSError:
+            return None
+        return etag if etag and os.path.isfile(body_path) else None
+
+    def request_headers(self, key: str) -> Optional[Dict]:
+        """Get the headers that revalidate the cached response, or None if nothing is cached."""
+        etag = self.get_etag(key)
+        return {"If-None-Match": etag} if etag else None
+
+    def open_not_modified(self, key: str, response: requests.Response) -> Optional[BinaryIO]:
+        """
+        Open the cached body if the server answered 304 Not Modified.
+        
+        Returns:
+            The open cached body, or None if the response has to be read instead
+        """
+        if not self.enabled or response.status_code != 304:
+            return None
+        try:
+            f = open(self.body_path(key), 'rb')
+        except OSError:
+            return None
+        logger.info("Mylar response unchanged, using cached copy")
+        return f
+
+    def load(self, key: str, response: requests.Response) -> Optional[bytes]:
+        """Read the cached body if the server answered 304 Not Modified, or return None."""
+        f = self.open_not_modified(key, response)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def store(self, key: str, response: requests.Response, body: bytes) -> None:
+        """Cache a response body, if the response has an ETag to revalidate it with."""
+        etag = response.headers.get("ETag")
+        if not self.enabled or not etag:
+            return
+        part_path = f"{self.body_path(key)}.part"
+        try:
+            _ensure_dir(self.cache_dir)
+            with open(part_path, 'wb') as f:
+                f.write(body)
+            self._commit(key, etag)
+        except OSError as e:
+            logger.warning("Failed to cache Mylar response: %s", e)
+
+    @contextlib.contextmanager
+    def tee(self, key: str, response: requests.Response) -> Iterator[Any]:
+        """
+        Yield the raw body stream of a response, copying it into the cache as it is
+        read when the response has an ETag. The copy only replaces the cached body
+        once the stream has been read to the end.
+        """
+        etag = response.headers.get("ETag")
+        if not self.enabled or not etag:
+            yield response.raw
+            return
+        
+        part_path = f"{self.body_path(key)}.part"
+        try:
+            _ensure_dir(self.cache_dir)
+            sink = open(part_path, 'wb')
+        except OSError as e:
+            logger.warning("Failed to cache Mylar response: %s", e)
+            yield response.raw
+            return
+        
+        try:
+            with sink:
+                yield _TeeReader(response.raw, sink)
+        except BaseException:
+            # Incomplete body (an error, or the caller stopped early) - don't keep it
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        
+        try:
+            self._commit(key, etag)
+        except OSError as e:
+            logger.warning("Failed to cache Mylar response: %s", e)
+
+    def _commit(self, key: str, etag: str) -> None:
+        """Move a fully written body from its .part file into place and record its ETag."""
+        body_path = self.body_path(key)
+        os.replace(f"{body_path}.part", body_path)
+        with open(f"{body_path}.etag", 'w') as f:
+            f.write(etag)
+
+
+class RateLimiter:
+    """Enforce a minimum interval between calls, shared across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Block until the next call is allowed.
+
+        Returns False if stop was set while waiting, so a queued caller
+        does not sit out its whole slot after Ctrl-C.
+        """
+        if self.interval <= 0:
+            return not (stop and stop.is_set())
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            logger.info("Sleeping for %.0f seconds...", wait_time)
+            if stop is not None:
+                return not stop.wait(wait_time)
+            time.sleep(wait_time)
+        return not (stop and stop.is_set())
+
+
+@dataclass
+class VolumePayload:
+    """Request body for adding a volume to Kapowarr."""
+    comicvine_id: str
+    root_folder_id: int
+    monitor: bool = True
+    monitor_new_issues: bool = True
+    auto_search: bool = False
+
+    def to_json(self) -> Dict:
+        """Convert the payload to a JSON-serializable dict."""
+        return asdict(self)
+
+
+def _canonical_comic(comic: Dict) -> Dict:
+    """
+    Normalize a Mylar comic entry in place so callers can rely on the
+    'id', 'name' and 'status' keys whichever Mylar version produced it.
+    """
+    comic["id"] = comic.get("id") or comic.get("ComicID") or comic.get("comicid")
+    comic["name"] = comic.get("name") or comic.get("ComicName") or comic.get("Title") or "Unknown Title"
+    comic["status"] = comic.get("status") or comic.get("Status") or ""
+    return comic
+
+
 class MylarAPI:
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, cache: Optional[ResponseCache] = None):
         """Initialize the Mylar API client."""
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = _create_session()
+        self.session.params = {"apikey": api_key}
+        
+        # On-disk cache for large responses that rarely change (e.g. getIndex)
+        self.cache = cache or ResponseCache()
+        
+        # Most recently used getComic results by comic ID, so repeated lookups don't hit the API again
+        self._comic_info_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._comic_info_lock = threading.Lock()
 
-    def _make_request(self, cmd: str, params: Dict = None) -> Dict:
-        """Make a request to the Mylar API."""
+    def _cache_key(self, all_params: Dict) -> str:
+        """Build the response cache key for a request."""
+        return f"{self.base_url}/api?" + "&".join(f"{k}={v}" for k, v in sorted(all_params.items()))
+
+    def _make_request(self, cmd: str, params: Dict = None, use_cache: bool = False) -> Dict:
+        """
+        Make a request to the Mylar API.
+        
+        With use_cache, the request is sent as a conditional request and a
+        304 Not Modified response is served from the on-disk cache.
+        """
         url = f"{self.base_url}/api"
-        all_params = {"apikey": self.api_key, "cmd": cmd}
+        all_params = {"cmd": cmd}
         if params:
             all_params.update(params)
         
+        cache_key = self._cache_key(all_params) if use_cache else None
+        headers = self.cache.request_headers(cache_key) if use_cache else None
+        
         logger.info(f"Fetching from Mylar: {url} with params {all_params}")
         try:
-            response = self.session.get(url, params=all_params)
-            logger.info(f"Mylar API response status code: {response.status_code}")
+            response = self.session.get(url, params=all_params, headers=headers)
+            logger.info(
+                "Mylar API response status code: %s (%s bytes)",
+                response.status_code,
+                response.headers.get("Content-Length", "unknown")
+            )
             
-            # Print raw response text for debugging
-            logger.info(f"Mylar API raw response: {response.text[:500]}...")
+            body = self.cache.load(cache_key, response) if use_cache else None
+            if body is None and response.status_code == 304:
+                # The cached body went missing after its ETag was sent - fetch it again
+                logger.warning("Cached Mylar response is missing, requesting it again")
+                response = self.session.get(url, params=all_params)
+            if body is None:
+                # Only decode the raw body for logging when DEBUG is enabled
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Mylar API raw response: %s...", response.text[:500])
+                
+                response.raise_for_status()
+                body = response.content
+                if use_cache:
+                    self.cache.store(cache_key, response, body)
             
-            response.raise_for_status()
-            data = response.json()
+            data = _json_loads(body)
             
             # Log the full response at DEBUG level
-            logger.debug(f"Mylar response JSON: {data}")
+            logger.debug("Mylar response JSON: %s", data)
             
             # Log a summary at INFO level
             if "success" in data:
@@ -80,7 +518,6 @@ class MylarAPI:
         # Create the download URL
         url = f"{self.base_url}/api"
         params = {
-            "apikey": self.api_key,
             "cmd": "downloadIssue",
             "id": issue_id
         }
@@ -96,33 +533,25 @@ class MylarAPI:
             content_type = response.headers.get('Content-Type', '')
             if 'application/json' in content_type:
                 # This is likely an error response
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 logger.error(f"Mylar API returned an error: {error_data}")
                 return ""
             
             # Get the filename from the Content-Disposition header if available
-            filename = ""
-            content_disposition = response.headers.get('Content-Disposition')
-            if content_disposition:
-                filename_match = re.search(r'filename="?([^"]+)"?', content_disposition)
-                if filename_match:
-                    filename = filename_match.group(1)
+            filename = _content_disposition_filename(response.headers.get('Content-Disposition'))
             
             # If no filename is provided, use a default format
             if not filename:
                 filename = f"issue_{issue_id}.cbz"
             
             # Make sure the destination directory exists
-            os.makedirs(destination_path, exist_ok=True)
+            _ensure_dir(destination_path)
             
             # Path to save the file
             file_path = os.path.join(destination_path, filename)
             
             # Save the file
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            _save_response_body(response, file_path)
             
             # Verify the file was written successfully
             if not os.path.exists(file_path):
@@ -157,7 +586,7 @@ class MylarAPI:
             A list of comics from the Mylar API
         """
         logger.info(f"Fetching comics from Mylar using '{cmd}' command")
-        data = self._make_request(cmd)
+        data = self._make_request(cmd, use_cache=True)
         
         # Try to extract comics from response
         comics = []
@@ -182,15 +611,105 @@ class MylarAPI:
                 sample = comics[0]
                 logger.info(f"Sample comic data format: {list(sample.keys())}")
         
-        return comics
+        return [_canonical_comic(comic) for comic in comics]
+    
+    def iter_comics(self, cmd: str = "getIndex") -> Iterator[Dict]:
+        """
+        Iterate over the comic series in Mylar one at a time.
+        
+        When ijson is installed the response is stream-parsed, so callers that
+        stop early (e.g. with a limit) don't pay for parsing the whole library.
+        Otherwise, or if the response has the older nested structure, this
+        falls back to get_comics(). If the stream fails after comics have
+        already been yielded the error is raised, since the list is incomplete.
+        """
+        if ijson is None:
+            yield from self.get_comics(cmd)
+            return
+        
+        url = f"{self.base_url}/api"
+        all_params = {"cmd": cmd}
+        cache_key = self._cache_key(all_params)
+        headers = self.cache.request_headers(cache_key)
+        
+        logger.info(f"Streaming comics from Mylar using '{cmd}' command")
+        found = False
+        shape = {}
+        try:
+            response = self.session.get(url, params=all_params, headers=headers, stream=True)
+            # Unchanged since the last run - parse the cached copy instead
+            cached = self.cache.open_not_modified(cache_key, response)
+            if cached is None and response.status_code == 304:
+                # The cached body went missing after its ETag was sent - fetch it again
+                response.close()
+                logger.warning("Cached Mylar response is missing, requesting it again")
+                response = self.session.get(url, params=all_params, stream=True)
+            with response:
+                if cached is not None:
+                    with cached:
+                        for comic in _iter_data_items(cached, shape):
+                            found = True
+                            yield _canonical_comic(comic)
+                else:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with self.cache.tee(cache_key, response) as stream:
+                        for comic in _iter_data_items(stream, shape):
+                            found = True
+                            yield _canonical_comic(comic)
+        except Exception as e:
+            if found:
+                # Comics were already handed out, so falling back would only hide a truncated library
+                logger.error(f"Failed part-way through streaming comics from Mylar API: {e}")
+                raise
+            logger.error(f"Failed to stream comics from Mylar API: {e}")
+        else:
+            # A complete "data" list, even an empty one, needs no second request
+            if shape.get("data") == "start_array":
+                return
+        
+        yield from self.get_comics(cmd)
     
     def get_comic_info(self, comic_id: str) -> Dict:
         """
         Fetch detailed information for a specific comic series.
+        The last COMIC_INFO_CACHE_SIZE successful results are cached.
         """
+        with self._comic_info_lock:
+            cached = self._comic_info_cache.get(comic_id)
+            if cached:
+                self._comic_info_cache.move_to_end(comic_id)
+                return cached
+        
         params = {"id": comic_id}
         data = self._make_request("getComic", params)
-        return data.get("data", {})
+        comic_info = data.get("data", {})
+        if comic_info:
+            with self._comic_info_lock:
+                self._comic_info_cache[comic_id] = comic_info
+                self._comic_info_cache.move_to_end(comic_id)
+                while len(self._comic_info_cache) > COMIC_INFO_CACHE_SIZE:
+                    self._comic_info_cache.popitem(last=False)
+        return comic_info
+    
+    def get_comic_infos(self, comic_ids: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Fetch detailed information for several comic series concurrently.
+        
+        Args:
+            comic_ids: The comic IDs in Mylar
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            A dict mapping each comic ID to its getComic data
+        """
+        if not comic_ids:
+            return {}
+        
+        logger.info(f"Prefetching info for {len(comic_ids)} comics from Mylar")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(comic_ids))) as executor:
+            results = executor.map(self.get_comic_info, comic_ids)
+            return dict(zip(comic_ids, results))
     
     def get_wanted(self) -> Dict:
         """
@@ -206,7 +725,12 @@ class KapowarrAPI:
         """Initialize the Kapowarr API client."""
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = _create_session()
+        self.session.params = {"api_key": api_key}
+        
+        # Kapowarr volume IDs by ComicVine ID, built lazily on first use
+        self._cv_index: Optional[Dict[str, Optional[int]]] = None
+        self._cv_index_lock = threading.Lock()
         
         # Verify API connection and authentication
         self._check_auth()
@@ -217,7 +741,7 @@ class KapowarrAPI:
         """
         url = f"{self.base_url}/api/auth/check"
         try:
-            response = self.session.post(url, params={"api_key": self.api_key})
+            response = self.session.post(url)
             response.raise_for_status()
             logger.info("Successfully authenticated to Kapowarr API")
         except Exception as e:
@@ -229,13 +753,11 @@ class KapowarrAPI:
         Make a request to the Kapowarr API.
         """
         url = f"{self.base_url}/api/{endpoint}"
-        all_params = {"api_key": self.api_key}
-        if params:
-            all_params.update(params)
         
-        headers = {"Content-Type": "application/json"} if json_data else None
+        headers = {"Content-Type": "application/json"} if json_data is not None else None
+        body = _json_dumps(json_data) if json_data is not None else None
         
-        logger.debug(f"Making {method} request to {url} with params {all_params}")
+        logger.debug(f"Making {method} request to {url} with params {params}")
         if json_data:
             logger.debug(f"Request body: {json_data}")
         
@@ -243,30 +765,30 @@ class KapowarrAPI:
             response = self.session.request(
                 method=method,
                 url=url,
-                params=all_params,
+                params=params,
                 headers=headers,
-                json=json_data
+                data=body
             )
             
             # Log status code at debug level
             logger.debug(f"Response status code: {response.status_code}")
             
-            # Try to get response text
-            try:
-                response_text = response.text
-                # Log full response at DEBUG level only
-                logger.debug(f"Response text: {response_text}")
-            except Exception:
-                response_text = "<unable to get response text>"
+            # Log full response at DEBUG level only
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response text: %s", response.text)
             
             # Raise exception for HTTP errors
             response.raise_for_status()
             
             # Parse and return JSON
             try:
-                return response.json()
+                return _json_loads(response.content)
             except Exception as e:
                 logger.error(f"Failed to parse JSON response from Kapowarr: {e}")
+                try:
+                    response_text = response.text
+                except Exception:
+                    response_text = "<unable to get response text>"
                 logger.error(f"Response text: {response_text}")
                 return {"error": "Invalid JSON response", "result": {}}
                 
@@ -279,21 +801,64 @@ class KapowarrAPI:
         response = self._make_request("GET", "rootfolder")
         return response.get("result", [])
 
-    def get_all_volumes(self) -> List[Dict]:
+    def get_all_volumes(self, sort: Optional[str] = None) -> List[Dict]:
         """
         Get all volumes from Kapowarr.
+        
+        Args:
+            sort: Optional sort order (e.g. "TITLE"). Left unset by default
+                  to spare Kapowarr a server-side sort when order doesn't matter.
         """
-        response = self._make_request("GET", "volumes", params={"sort": "TITLE"})
+        params = {"sort": sort} if sort else None
+        response = self._make_request("GET", "volumes", params=params)
         return response.get("result", [])
 
+    def _get_cv_index(self) -> Dict[str, Optional[int]]:
+        """
+        Get the Kapowarr volume IDs of the volumes already added, keyed by ComicVine ID.
+        The volume list is fetched once and cached until invalidate_cache() is called.
+        """
+        with self._cv_index_lock:
+            if self._cv_index is None:
+                volumes = self.get_all_volumes()
+                self._cv_index = {
+                    str(vol.get("comicvine_id")): vol.get("id")
+                    for vol in volumes
+                    if vol.get("comicvine_id") is not None
+                }
+                logger.debug(f"Cached {len(self._cv_index)} ComicVine IDs from Kapowarr")
+            return self._cv_index
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached volume index so the next lookup refetches it from Kapowarr."""
+        with self._cv_index_lock:
+            self._cv_index = None
+
+    def get_all_volume_comicvine_ids(self) -> Set[str]:
+        """
+        Get the ComicVine IDs of all volumes in Kapowarr with a single request.
+        The returned set is a snapshot; use is_volume_added() to see later adds.
+        """
+        index = self._get_cv_index()
+        with self._cv_index_lock:
+            return set(index)
+
+    def get_volume_id(self, comicvine_id: str) -> Optional[int]:
+        """
+        Get the Kapowarr volume ID for a ComicVine ID.
+        
+        Returns:
+            The volume ID, or None if the volume isn't in Kapowarr or its ID is unknown
+        """
+        return self._get_cv_index().get(str(comicvine_id))
+
     def is_volume_added(self, comicvine_id: str) -> bool:
         """
         Check if a volume with the given ComicVine ID is already added to Kapowarr.
         """
-        volumes = self.get_all_volumes()
-        return any(str(vol.get("comicvine_id")) == str(comicvine_id) for vol in volumes)
+        return str(comicvine_id) in self._get_cv_index()
 
-    def add_volume(self, volume_data: Dict) -> Dict:
+    def add_volume(self, volume_data: VolumePayload) -> Dict:
         """
         Add a new comic volume to Kapowarr using the API.
         
@@ -302,38 +867,26 @@ class KapowarrAPI:
             In case of 'VolumeAlreadyAdded' error, returns {'error': 'VolumeAlreadyAdded'}
         """
         # First check if the volume is already added
-        comicvine_id = volume_data.get("comicvine_id")
+        comicvine_id = volume_data.comicvine_id
         if comicvine_id and self.is_volume_added(comicvine_id):
             logger.info(f"Volume with ComicVine ID {comicvine_id} is already added to Kapowarr")
             return {"error": "VolumeAlreadyAdded"}
 
         logger.info(f"Adding volume to Kapowarr with data: {volume_data}")
         try:
-            # Make a copy of volume_data to avoid modifying the original
-            formatted_data = volume_data.copy()
-            
-            # Ensure comicvine_id is not None and is properly formatted
-            if formatted_data.get("comicvine_id") is None:
+            if comicvine_id is None:
                 raise ValueError("comicvine_id cannot be None")
-                
-            # If root_folder_id is a string, convert to int
-            if isinstance(formatted_data.get("root_folder_id"), str):
-                try:
-                    formatted_data["root_folder_id"] = int(formatted_data["root_folder_id"])
-                except ValueError:
-                    logger.warning(f"Could not convert root_folder_id '{formatted_data['root_folder_id']}' to integer")
             
-            # Boolean values should be actual Python booleans
-            for key in ['monitor', 'monitor_new_issues', 'auto_search']:
-                if key in formatted_data and isinstance(formatted_data[key], str):
-                    if formatted_data[key].lower() == 'true':
-                        formatted_data[key] = True
-                    elif formatted_data[key].lower() == 'false':
-                        formatted_data[key] = False
-            
-            logger.debug(f"Sending formatted volume data to Kapowarr: {formatted_data}")
-            response = self._make_request("POST", "volumes", json_data=formatted_data)
-            return response.get("result", {})
+            response = self._make_request("POST", "volumes", json_data=volume_data.to_json())
+            result = response.get("result", {})
+            if result.get("id"):
+                index = self._get_cv_index()
+                with self._cv_index_lock:
+                    index[str(comicvine_id)] = result["id"]
+            else:
+                # Without the new volume's ID the index would be incomplete, so refetch it
+                self.invalidate_cache()
+            return result
         except Exception as e:
             # Check if there's an error message in the response
             error_message = str(e)
@@ -344,7 +897,7 @@ class KapowarrAPI:
                     error_text = e.response.text
                     logger.debug(f"Full error response: {error_text}")
                     try:
-                        error_json = e.response.json()
+                        error_json = _json_loads(e.response.content)
                         if 'error' in error_json:
                             error_message = f"{error_message} - API error: {error_json['error']}"
                             # Check if this is a VolumeAlreadyAdded error
@@ -360,7 +913,9 @@ class KapowarrAPI:
             
             # Special handling for VolumeAlreadyAdded error
             if error_type == "VolumeAlreadyAdded" or "VolumeAlreadyAdded" in error_message:
-                logger.info(f"Volume already exists in Kapowarr (ComicVine ID: {volume_data.get('comicvine_id')})")
+                logger.info(f"Volume already exists in Kapowarr (ComicVine ID: {comicvine_id})")
+                # The volume exists but its ID is unknown here; the next lookup refetches it
+                self.invalidate_cache()
                 return {"error": "VolumeAlreadyAdded", "message": error_message}
             
             logger.error(f"Failed to add volume to Kapowarr: {error_message}")
@@ -479,79 +1034,199 @@ def copy_files_to_kapowarr(
         return 0
     
     # Log the number of files we're processing
-    logger.info(f"Processing {len(mylar_files)} files for volume ID {volume_id}")
-    for i, file_info in enumerate(mylar_files):
-        issue_number = file_info.get("issue_number", "unknown")
-        file_path = file_info.get("file_path", "unknown")
-        logger.info(f"File {i+1}/{len(mylar_files)}: Issue #{issue_number}, Path: {file_path}")
+    logger.info("Processing %d files for volume ID %s", len(mylar_files), volume_id)
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, file_info in enumerate(mylar_files):
+            logger.debug(
+                "File %d/%d: Issue #%s, Path: %s",
+                i + 1,
+                len(mylar_files),
+                file_info.get("issue_number", "unknown"),
+                file_info.get("file_path", "unknown")
+            )
     
     # Using direct file copy method
     # Make sure the folder starts with the Kapowarr container path
-    if not volume_folder.startswith("/comics-1/"):
-        volume_folder = os.path.join("/comics-1", volume_folder)
+    if not volume_folder.startswith(KAPOWARR_CONTAINER_PREFIX):
+        volume_folder = os.path.join(KAPOWARR_CONTAINER_PREFIX, volume_folder)
     
     # Convert to host path for file operations
-    host_volume_folder = volume_folder.replace("/comics-1/", f"{kapowarr_root}/")
+    host_volume_folder = _map_path_prefix(
+        volume_folder, ((KAPOWARR_CONTAINER_PREFIX, f"{kapowarr_root}/"),)
+    ) or volume_folder
+    
+    # Normalize once so destination paths can be joined with a plain "/"
+    host_volume_folder = host_volume_folder.rstrip("/")
+    
+    mylar_path_rules = ((MYLAR_CONTAINER_PREFIX, f"{mylar_root}/"),)
     
     # Create the destination folder if it doesn't exist
-    os.makedirs(host_volume_folder, exist_ok=True)
+    _ensure_dir(host_volume_folder)
     
-    copied_count = 0
+    # Index files already in the volume folder by size, so re-runs can skip
+    # sources that were copied before under a slightly different name
+    existing_by_size: Dict[int, List[str]] = {}
+    with os.scandir(host_volume_folder) as entries:
+        for entry in entries:
+            if entry.is_file():
+                existing_by_size.setdefault(entry.stat().st_size, []).append(entry.path)
     
-    for file_info in mylar_files:
+    def _destination(file_info: Dict) -> str:
+        """Get the host path a Mylar file is copied to."""
+        filename = os.path.basename(file_info["file_path"])
+        
+        # Enhance the destination filename with issue number if available
+        issue_number = file_info.get("issue_number", "")
+        # Same test as the pattern "#\s*<number>", without compiling a regex per issue
+        if issue_number and not any(
+            part.lstrip().startswith(issue_number) for part in filename.split("#")[1:]
+        ):
+            base, ext = os.path.splitext(filename)
+            filename = f"{base} #{issue_number.zfill(3)}{ext}"
+            logger.info("Enhanced destination filename with issue number: %s", filename)
+        
+        return f"{host_volume_folder}/{filename}"
+    
+    def _copy_one(file_info: Dict, dest_host_path: str) -> bool:
+        """Copy a single Mylar file into the volume folder. Returns True if it is in place."""
         source_path = file_info["file_path"]
         
         # Convert container path to host path if needed
-        if source_path.startswith("/comics/"):
-            source_host_path = source_path.replace("/comics/", f"{mylar_root}/")
-        else:
-            source_host_path = source_path
+        source_host_path = _map_path_prefix(source_path, mylar_path_rules) or source_path
+        
+        # Stat once and reuse the result instead of repeated isfile() calls
+        source_stat = _stat_or_none(source_host_path)
+        source_is_file = source_stat is not None and stat.S_ISREG(source_stat.st_mode)
         
         # Additional check: some paths might be absolute but not in container format
-        if not os.path.isfile(source_host_path) and not source_host_path.startswith(mylar_root):
+        if not source_is_file and not source_host_path.startswith(mylar_root):
             # Try to interpret it as a relative path within the mylar root
             alternative_path = os.path.join(mylar_root, source_host_path.lstrip('/'))
-            if os.path.isfile(alternative_path):
-                logger.info(f"Found file at alternative path: {alternative_path}")
+            alternative_stat = _stat_or_none(alternative_path)
+            if alternative_stat is not None and stat.S_ISREG(alternative_stat.st_mode):
+                logger.info("Found file at alternative path: %s", alternative_path)
                 source_host_path = alternative_path
+                source_stat = alternative_stat
+                source_is_file = True
         
-        if not os.path.isfile(source_host_path):
-            logger.warning(f"Source file does not exist: {source_host_path}")
-            continue
+        if not source_is_file:
+            logger.warning("Source file does not exist: %s", source_host_path)
+            return False
         
-        # Get the filename and create the destination path
-        filename = os.path.basename(source_path)
-        dest_host_path = os.path.join(host_volume_folder, filename)
+        if _stat_or_none(dest_host_path) is not None:
+            logger.info("File already exists at destination: %s", dest_host_path)
+            return True
         
-        # Enhance the destination filename with issue number if available
-        issue_number = file_info.get("issue_number", "")
-        if issue_number and not re.search(rf'#\s*{issue_number}', filename):
-            base, ext = os.path.splitext(filename)
-            dest_filename = f"{base} #{issue_number.zfill(3)}{ext}"
-            dest_host_path = os.path.join(host_volume_folder, dest_filename)
-            logger.info(f"Enhanced destination filename with issue number: {dest_filename}")
-        
-        if os.path.exists(dest_host_path):
-            logger.info(f"File already exists at destination: {dest_host_path}")
-            copied_count += 1
-            continue
+        for existing_path in existing_by_size.get(source_stat.st_size, []):
+            if _files_equivalent(source_host_path, source_stat, existing_path):
+                logger.info("Same file already exists at destination: %s", existing_path)
+                return True
         
         try:
             if not dry_run:
-                logger.info(f"Copying from {source_host_path} to {dest_host_path}")
-                shutil.copy2(source_host_path, dest_host_path)
+                logger.info("Copying from %s to %s", source_host_path, dest_host_path)
+                _clone_or_copy(source_host_path, dest_host_path)
                 # Set appropriate permissions
                 os.chmod(dest_host_path, 0o644)  # rw-r--r--
-                copied_count += 1
             else:
-                logger.info(f"DRY RUN: Would copy from {source_host_path} to {dest_host_path}")
-                copied_count += 1
+                logger.info("DRY RUN: Would copy from %s to %s", source_host_path, dest_host_path)
+            return True
         except Exception as e:
-            logger.error(f"Error copying file {source_host_path} to {dest_host_path}: {e}")
+            logger.error("Error copying file %s to %s: %s", source_host_path, dest_host_path, e)
+            return False
+    
+    # Sources that map to the same destination are copied in order by a single worker,
+    # so two copies never write the same file at once
+    files_by_destination: Dict[str, List[Dict]] = {}
+    for file_info in mylar_files:
+        files_by_destination.setdefault(_destination(file_info), []).append(file_info)
+    
+    def _copy_to(item: Tuple[str, List[Dict]]) -> int:
+        dest_host_path, file_infos = item
+        return sum(_copy_one(file_info, dest_host_path) for file_info in file_infos)
+    
+    # Each destination is independent I/O, so copy several at once
+    with ThreadPoolExecutor(max_workers=min(8, len(files_by_destination))) as executor:
+        copied_count = sum(executor.map(_copy_to, files_by_destination.items()))
     
     return copied_count
 
 
+def _normalize_comicvine_id(comicvine_id: Any) -> str:
+    """
+    Normalize a ComicVine ID the way Kapowarr stores it.
+    Kapowarr expects numeric IDs, so any prefix like "4050-" is removed.
+    """
+    cv_id = str(comicvine_id)
+    if '-' in cv_id:
+        cv_id = cv_id.split('-')[-1]
+    return cv_id
+
+
+def _mylar_issue_number(mylar_issue: Dict) -> str:
+    """Get the issue number of a Mylar issue, trying the different possible field names."""
+    return str(
+        mylar_issue.get("issue_number", "") or 
+        mylar_issue.get("Issue_Number", "") or 
+        mylar_issue.get("IssueNumber", "") or
+        mylar_issue.get("number", "")
+    )
+
+
+def _download_mylar_issue(
+    mylar: MylarAPI,
+    issue_id: str,
+    host_folder: str,
+    existing_files: Optional[set] = None,
+    log_prefix: str = ""
+) -> str:
+    """
+    Download a single issue from Mylar's downloadIssue endpoint into host_folder.
+    Uses the Mylar client's pooled session so connections are reused across downloads.
+    
+    Args:
+        mylar: The Mylar API client
+        issue_id: The issue ID in Mylar
+        host_folder: The directory to save the file in
+        existing_files: Filenames already in host_folder; matching issues are not downloaded again
+        log_prefix: Prepended to log messages so they can be told apart when comics run concurrently
+    
+    Returns:
+        The outcome: "downloaded", "present" (already in host_folder), "placeholder" or "failed"
+    """
+    url = f"{mylar.base_url}/api"
+    params = {
+        "cmd": "downloadIssue",
+        "id": issue_id  # This should be the issue ID, not the comic ID
+    }
+    
+    try:
+        with mylar.session.get(url, params=params, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            # Get filename from Content-Disposition header
+            filename = _content_disposition_filename(response.headers.get('Content-Disposition'))
+            
+            if not filename:
+                logger.info("%s ⚠ Skipping placeholder file for issue %s (not yet released/downloaded)", log_prefix, issue_id)
+                return "placeholder"
+            
+            file_path = os.path.join(host_folder, filename)
+            
+            # The headers are enough to know the filename, so skip the body if we already have it
+            if existing_files is not None and filename in existing_files:
+                logger.info("%s ✓ Already downloaded to %s", log_prefix, file_path)
+                return "present"
+            
+            _save_response_body(response, file_path)
+        
+        logger.info("%s ✓ Downloaded to %s", log_prefix, file_path)
+        return "downloaded"
+    except Exception as e:
+        logger.error("%s ✗ Failed to download issue %s: %s", log_prefix, issue_id, e)
+        return "failed"
+
+
 def migrate_comics(
     mylar_url: str, 
     mylar_api_key: str, 
@@ -565,45 +1240,52 @@ def migrate_comics(
     resume_from: str = None,
     refresh_scan: bool = False,
     mass_rename: bool = False,
-    delay: int = 20
+    delay: int = 20,
+    concurrency: int = 4,
+    force_redownload: bool = False,
+    use_cache: bool = True
 ):
     """
     Migrate comics from Mylar to Kapowarr.
+    
+    Up to `concurrency` comics are processed at once, while volume adds
+    (which make Kapowarr query ComicVine) stay at least `delay` seconds apart.
+    Every log line for a comic is prefixed with its "[n/total] title" so the
+    output stays readable when comics run concurrently.
+    Issues whose file already exists in the volume folder are not downloaded
+    again unless `force_redownload` is set. With `use_cache` off, the Mylar
+    comic index is always fetched in full instead of revalidating the
+    on-disk copy.
     """
-    mylar = MylarAPI(mylar_url, mylar_api_key)
+    mylar = MylarAPI(mylar_url, mylar_api_key, cache=ResponseCache(enabled=use_cache))
     kapowarr = KapowarrAPI(kapowarr_url, kapowarr_api_key)
     
-    # Get list of comics from Mylar using getIndex command
+    # Get list of comics from Mylar using getIndex command, stopping early if limited
     try:
-        comics = mylar.get_comics(cmd="getIndex")
+        if limit and limit > 0:
+            comics = list(itertools.islice(mylar.iter_comics(cmd="getIndex"), limit))
+            logger.info("Limiting migration to first %d comics", limit)
+        else:
+            comics = list(mylar.iter_comics(cmd="getIndex"))
     except Exception as e:
-        logger.error(f"Failed to retrieve comics from Mylar: {e}")
+        logger.error("Failed to retrieve comics from Mylar: %s", e)
         return
     
-    logger.info(f"Found {len(comics)} comics in Mylar")
+    logger.info("Found %d comics in Mylar", len(comics))
     
     # Get wanted issues for monitoring
     wanted_issues_data = mylar.get_wanted()
-    wanted_issues = set()
+    wanted_issues = {
+        issue["IssueID"]
+        for key in ("issues", "annuals")
+        for issue in wanted_issues_data.get(key, [])
+        if issue.get("IssueID")
+    }
     
-    # Process issues
-    for issue in wanted_issues_data.get("issues", []):
-        issue_id = issue.get("IssueID")
-        if issue_id:
-            wanted_issues.add(issue_id)
+    logger.info("Found %d wanted issues in Mylar", len(wanted_issues))
     
-    # Process annuals
-    for annual in wanted_issues_data.get("annuals", []):
-        issue_id = annual.get("IssueID")
-        if issue_id:
-            wanted_issues.add(issue_id)
-    
-    logger.info(f"Found {len(wanted_issues)} wanted issues in Mylar")
-    
-    # Apply limit if specified
-    if limit and limit > 0:
-        comics = comics[:limit]
-        logger.info(f"Limiting migration to first {limit} comics")
+    # Container to host path mapping for Kapowarr volume folders
+    kapowarr_path_rules = ((KAPOWARR_CONTAINER_PREFIX, f"{kapowarr_root}/"),)
     
     # If resuming, skip until we find the comic to resume from
     if resume_from:
@@ -611,207 +1293,318 @@ def migrate_comics(
         resume_index = None
         
         for i, comic in enumerate(comics):
-            if comic.get("name", "").lower() == resume_from:
+            if comic["name"].lower() == resume_from:
                 resume_index = i
                 break
         
         if resume_index is not None:
             comics = comics[resume_index:]
-            logger.info(f"Resuming migration from {resume_from} ({len(comics)} comics remaining)")
+            logger.info("Resuming migration from %s (%d comics remaining)", resume_from, len(comics))
         else:
-            logger.warning(f"Could not find comic '{resume_from}' to resume from")
+            logger.warning("Could not find comic '%s' to resume from", resume_from)
+    
+    # Work out each comic's IDs and monitoring status once, up front
+    for comic in comics:
+        comic["_cv_id"] = _normalize_comicvine_id(comic["id"]) if comic["id"] else ""
+        # For this example, we assume that if the comic's status is "Active", we want to monitor it.
+        status = comic["status"]
+        comic["_monitored"] = isinstance(status, str) and status.lower() == "active"
+    
+    # Fetch the ComicVine IDs already in Kapowarr once, instead of checking per comic
+    existing_ids = kapowarr.get_all_volume_comicvine_ids()
+    logger.info("Found %d volumes already in Kapowarr", len(existing_ids))
     
-    # Process each comic from Mylar's response
-    for idx, comic in enumerate(comics, start=1):
-        # Extract data based on command format
-        title = comic.get("name") or comic.get("ComicName") or comic.get("Title") or "Unknown Title"
-        comicvine_id = comic.get("id") or comic.get("ComicID") or comic.get("comicid")
+    # Warm the Mylar comic info cache concurrently for the first comics that still need to be
+    # added; later ones are fetched as they come up so the cache stays bounded
+    if copy_files:
+        pending_ids = [
+            comic["id"]
+            for comic in comics
+            if comic["id"] and comic["_cv_id"] not in existing_ids
+        ]
+        mylar.get_comic_infos(pending_ids[:COMIC_INFO_CACHE_SIZE])
+    
+    # Space out volume adds across workers to respect ComicVine API rate limits
+    rate_limiter = RateLimiter(delay)
+    if delay <= 0:
+        logger.warning("No delay between comics - this may hit ComicVine API rate limits")
+    
+    # Set on Ctrl-C so queued comics are skipped instead of still being added
+    stopping = threading.Event()
+    
+    def _download_issues(comicvine_id: str, kap_volume_id: int, kap_volume: Dict, prefix: str) -> None:
+        """
+        Download the Mylar files for the issues of a Kapowarr volume into its folder.
+        Issues whose file is already in the folder are skipped unless force_redownload is set.
+        """
+        # Get issues from Kapowarr
+        issues = kap_volume.get("issues", [])
+        if not issues:
+            logger.warning("%s no issues found in Kapowarr", prefix)
+            return
+        logger.info("%s found %d issues in Kapowarr", prefix, len(issues))
         
-        if not comicvine_id:
-            logger.warning(f"Skipping comic '{title}' as it has no ComicVine ID")
-            continue
+        # Get corresponding issues from Mylar
+        mylar_issues = []
+        comic_info = mylar.get_comic_info(comicvine_id)
+        if comic_info and "issues" in comic_info:
+            mylar_issues = comic_info.get("issues", [])
+            logger.info("%s found %d issues in Mylar", prefix, len(mylar_issues))
+        else:
+            logger.warning("%s no issues found in Mylar", prefix)
+        
+        # Get volume destination path
+        kapowarr_folder = kap_volume.get("folder", "")
+        if not kapowarr_folder:
+            logger.warning("%s no folder specified in Kapowarr", prefix)
+            return
             
-        # For this example, we assume that if the comic's status is "Active", we want to monitor it.
-        status = comic.get("status") or comic.get("Status") or ""
-        if isinstance(status, str):
-            status = status.lower()
-        monitored = status == "active"
+        # Convert to host path
+        host_folder = _map_path_prefix(kapowarr_folder, kapowarr_path_rules)
+        if host_folder is None:
+            host_folder = os.path.join(kapowarr_root, kapowarr_folder.lstrip("/"))
         
-        logger.info(f"[{idx}/{len(comics)}] {title}")
+        # Make sure the destination directory exists
+        _ensure_dir(host_folder)
         
-        # Check if this comic is already added to Kapowarr
-        if kapowarr.is_volume_added(comicvine_id):
-            logger.info(f"✓ Already in Kapowarr")
-            continue
+        # Files already in the folder (e.g. from an interrupted run) aren't downloaded again
+        existing_files = None
+        if not force_redownload:
+            with os.scandir(host_folder) as entries:
+                existing_files = {entry.name for entry in entries}
         
-        # Prepare the payload for adding a new volume
-        # Kapowarr might expect numeric IDs for comicvine_id
-        # Try to remove any non-numeric prefix (like "4050-")
-        cv_id = str(comicvine_id)
-        if '-' in cv_id:
-            cv_id = cv_id.split('-')[-1]
-        
-        # Keep it simple - only include required fields
-        volume_data = {
-            "comicvine_id": cv_id,
-            "root_folder_id": int(root_folder_id)
-        }
+        # Match Kapowarr issues to Mylar issues, then download the matches concurrently
+        download_ids = []
+        download_count = 0
+        
+        # Index Mylar issue IDs by issue number once, keeping the first match
+        # Get the issue ID - this is different from the comic ID (in getComic response, it's just "id")
+        mylar_ids_by_number = {}
+        for mylar_issue in mylar_issues:
+            mylar_issue_id = mylar_issue.get("id")
+            if mylar_issue_id:
+                mylar_ids_by_number.setdefault(_mylar_issue_number(mylar_issue), mylar_issue_id)
+        
+        # Process each issue from Kapowarr
+        for issue in issues:
+            # Get issue number from Kapowarr
+            issue_number = issue.get("issue_number", "")
+            
+            # Match by issue number with Mylar issues
+            mylar_issue_id = mylar_ids_by_number.get(str(issue_number))
+            if not mylar_issue_id:
+                logger.warning("%s ✗ No matching Mylar issue found for issue #%s", prefix, issue_number)
+                continue
+            
+            logger.info("%s ✓ Issue #%s (ID: %s)", prefix, issue_number, mylar_issue_id)
+            
+            if not dry_run:
+                download_ids.append(mylar_issue_id)
+            else:
+                logger.info("%s ✓ Would download issue #%s", prefix, issue_number)
+                download_count += 1
+        
+        # Kapowarr issues that share an issue number map to the same Mylar issue. Download each
+        # one once, as concurrent downloads of the same file would write the same .part file
+        download_ids = list(dict.fromkeys(download_ids))
+        
+        if download_ids:
+            with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(download_ids))) as executor:
+                download_outcomes = Counter(executor.map(
+                    lambda issue_id: _download_mylar_issue(mylar, issue_id, host_folder, existing_files, prefix),
+                    download_ids
+                ))
+            download_count += download_outcomes["downloaded"]
+            if download_outcomes["present"]:
+                logger.info("%s %d files were already present", prefix, download_outcomes["present"])
         
-        # Only add optional fields if they need non-default values
-        if not monitored:  # Default is True
-            volume_data["monitor"] = False
-            volume_data["monitor_new_issues"] = False
+        logger.info("%s downloaded %d files", prefix, download_count)
+        
+        # If refresh_scan is enabled, trigger a refresh and scan task
+        if refresh_scan and not dry_run and download_count > 0:
+            logger.info("%s ✓ Triggering refresh and scan", prefix)
+            kapowarr.refresh_and_scan_volume(kap_volume_id)
+            
+        # If mass_rename is enabled, trigger a mass rename task
+        if mass_rename and not dry_run and download_count > 0:
+            logger.info("%s ✓ Triggering mass rename", prefix)
+            kapowarr.mass_rename_issue(kap_volume_id)
+    
+    def _download_existing(comicvine_id: str, cv_id: str, prefix: str) -> str:
+        """
+        Download missing files for a comic whose volume is already in Kapowarr,
+        e.g. because a previous run was interrupted part-way through its issues.
+        
+        Returns:
+            The outcome: "exists" or "failed"
+        """
+        kap_volume_id = kapowarr.get_volume_id(cv_id)
+        if not kap_volume_id:
+            logger.warning("%s could not find its Kapowarr volume, not checking for missing files", prefix)
+            return "exists"
+        
+        try:
+            # Only issues Kapowarr has no file for need Mylar, so most re-runs stop here
+            kap_volume = kapowarr.get_volume(kap_volume_id)
+            missing = [issue for issue in kap_volume.get("issues", []) if not issue.get("files")]
+            if not missing:
+                logger.debug("%s no missing files", prefix)
+                return "exists"
+            
+            logger.info("%s checking %d issues without files", prefix, len(missing))
+            _download_issues(comicvine_id, kap_volume_id, dict(kap_volume, issues=missing), prefix)
+        except Exception as e:
+            logger.error("%s ✗ Failed to process: %s", prefix, e)
+            return "failed"
+        return "exists"
+    
+    def _process_one_comic(comic: Dict, idx: int, total: int) -> str:
+        """
+        Migrate a single comic from Mylar to Kapowarr.
+        
+        Returns:
+            The outcome: "added", "exists", "skipped" or "failed"
+        """
+        title = comic["name"]
+        comicvine_id = comic["id"]
+        cv_id = comic["_cv_id"]
+        monitored = comic["_monitored"]
+        prefix = f"[{idx}/{total}] {title}:"
+        
+        if stopping.is_set():
+            return "skipped"
+        
+        if not comicvine_id:
+            logger.warning("%s skipping, it has no ComicVine ID", prefix)
+            return "skipped"
+        
+        # Check if this comic is already added to Kapowarr. When resuming without copying
+        # files, the user already expects earlier comics to be done, so keep those lines
+        # out of the INFO log.
+        if cv_id in existing_ids and resume_from and not copy_files:
+            logger.debug("%s already in Kapowarr", prefix)
+            return "exists"
+        
+        if cv_id in existing_ids:
+            logger.info("%s ✓ Already in Kapowarr", prefix)
+            return _download_existing(comicvine_id, cv_id, prefix) if copy_files else "exists"
+        
+        logger.info("%s adding to Kapowarr", prefix)
+        
+        # Prepare the payload for adding a new volume
+        volume_data = VolumePayload(
+            comicvine_id=cv_id,
+            root_folder_id=int(root_folder_id),
+            monitor=monitored,
+            monitor_new_issues=monitored
+        )
         
         try:
             # Add the volume to Kapowarr
+            if not rate_limiter.wait(stopping):
+                return "skipped"
             kap_result = kapowarr.add_volume(volume_data)
             
             # Check for VolumeAlreadyAdded error
             if isinstance(kap_result, dict) and kap_result.get("error") == "VolumeAlreadyAdded":
-                logger.info(f"✓ Already in Kapowarr")
-                continue
+                logger.info("%s ✓ Already in Kapowarr", prefix)
+                return _download_existing(comicvine_id, cv_id, prefix) if copy_files else "exists"
             
             # Normal successful add
             kap_volume_id = kap_result.get("id")
             
             if not kap_volume_id:
-                logger.error(f"Failed to get volume ID after adding {title} to Kapowarr")
-                continue
+                logger.error("%s ✗ Failed to get volume ID after adding to Kapowarr", prefix)
+                return "failed"
                 
-            logger.info(f"✓ Added to Kapowarr (ID: {kap_volume_id})")
-            
-            # Get volume details to get folder path
-            kap_volume = kapowarr.get_volume(kap_volume_id)
+            logger.info("%s ✓ Added to Kapowarr (ID: %s)", prefix, kap_volume_id)
             
             # If copy_files is enabled, download files from Mylar API directly
             if copy_files:
-                # Get issues from Kapowarr
-                issues = kap_volume.get("issues", [])
-                if not issues:
-                    logger.warning(f"No issues found in Kapowarr")
+                # Get volume details to get folder path, unless the add response already has them
+                if "folder" in kap_result and "issues" in kap_result:
+                    kap_volume = kap_result
                 else:
-                    logger.info(f"Found {len(issues)} issues in Kapowarr")
-                    
-                    # Get corresponding issues from Mylar
-                    mylar_issues = []
-                    comic_info = mylar.get_comic_info(comicvine_id)
-                    if comic_info and "issues" in comic_info:
-                        mylar_issues = comic_info.get("issues", [])
-                        logger.info(f"Found {len(mylar_issues)} issues in Mylar")
-                    else:
-                        logger.warning(f"No issues found in Mylar")
-                    
-                    # Get volume destination path
-                    kapowarr_folder = kap_volume.get("folder", "")
-                    if not kapowarr_folder:
-                        logger.warning(f"No folder specified in Kapowarr")
-                        continue
-                        
-                    # Convert to host path
-                    if kapowarr_folder.startswith("/comics-1/"):
-                        host_folder = kapowarr_folder.replace("/comics-1/", f"{kapowarr_root}/")
-                    else:
-                        host_folder = os.path.join(kapowarr_root, kapowarr_folder.lstrip("/"))
-                    
-                    # Make sure the destination directory exists
-                    os.makedirs(host_folder, exist_ok=True)
-                    
-                    # Count successful downloads
-                    download_count = 0
-                    
-                    # Process each issue from Kapowarr
-                    for issue in issues:
-                        # Get issue number from Kapowarr
-                        issue_number = issue.get("issue_number", "")
-                        
-                        # Try to match by issue number with Mylar issues
-                        matched = False
-                        for mylar_issue in mylar_issues:
-                            # Try different possible field names for issue number
-                            mylar_issue_num = (
-                                mylar_issue.get("issue_number", "") or 
-                                mylar_issue.get("Issue_Number", "") or 
-                                mylar_issue.get("IssueNumber", "") or
-                                mylar_issue.get("number", "")
-                            )
-                            if str(mylar_issue_num) == str(issue_number):
-                                # Found matching issue by number
-                                # Get the issue ID - this is different from the comic ID
-                                mylar_issue_id = mylar_issue.get("id")  # In getComic response, it's just "id"
-                                if mylar_issue_id:
-                                    matched = True
-                                    logger.info(f"  ✓ Issue #{issue_number} (ID: {mylar_issue_id})")
-                                    
-                                    if not dry_run:
-                                        # Download the issue from Mylar using the downloadIssue endpoint
-                                        url = f"{mylar_url}/api"
-                                        params = {
-                                            "apikey": mylar_api_key,
-                                            "cmd": "downloadIssue",
-                                            "id": mylar_issue_id  # This should be the issue ID, not the comic ID
-                                        }
-                                        
-                                        try:
-                                            response = requests.get(url, params=params, stream=True)
-                                            response.raise_for_status()
-                                            
-                                            # Get filename from Content-Disposition header
-                                            filename = None
-                                            if 'Content-Disposition' in response.headers:
-                                                content_disposition = response.headers['Content-Disposition']
-                                                filename_match = re.search(r'filename="([^"]+)"', content_disposition)
-                                                if filename_match:
-                                                    filename = filename_match.group(1)
-                                            
-                                            if not filename:
-                                                filename = f"issue_{mylar_issue_id}.cbz"
-                                                logger.info(f"    ⚠ Skipping placeholder file (not yet released/downloaded)")
-                                                continue
-                                            
-                                            file_path = os.path.join(host_folder, filename)
-                                            
-                                            with open(file_path, 'wb') as f:
-                                                for chunk in response.iter_content(chunk_size=8192):
-                                                    if chunk:
-                                                        f.write(chunk)
-                                            
-                                            logger.info(f"    ✓ Downloaded to {file_path}")
-                                            download_count += 1
-                                        except Exception as e:
-                                            logger.error(f"    ✗ Failed to download: {e}")
-                                    else:
-                                        logger.info(f"    ✓ Would download")
-                                        download_count += 1
-                                    break
-                        
-                        if not matched:
-                            logger.warning(f"  ✗ No matching Mylar issue found for issue #{issue_number}")
-                    
-                    logger.info(f"  Downloaded {download_count} files")
-                    
-                    # If refresh_scan is enabled, trigger a refresh and scan task
-                    if refresh_scan and not dry_run and download_count > 0:
-                        logger.info(f"  ✓ Triggering refresh and scan")
-                        kapowarr.refresh_and_scan_volume(kap_volume_id)
-                        
-                    # If mass_rename is enabled, trigger a mass rename task
-                    if mass_rename and not dry_run and download_count > 0:
-                        logger.info(f"  ✓ Triggering mass rename")
-                        kapowarr.mass_rename_issue(kap_volume_id)
+                    kap_volume = kapowarr.get_volume(kap_volume_id)
+                _download_issues(comicvine_id, kap_volume_id, kap_volume, prefix)
             
         except Exception as e:
-            logger.error(f"✗ Failed to process: {e}")
+            logger.error("%s ✗ Failed to process: %s", prefix, e)
+            return "failed"
         
-        # Sleep to respect ComicVine API rate limits
-        if delay > 0:
-            logger.info(f"Sleeping for {delay} seconds...")
-            time.sleep(delay)
-        else:
-            logger.warning("No delay between comics - this may hit ComicVine API rate limits")
+        return "added"
+    
+    # Process comics concurrently; the rate limiter keeps volume adds spaced out
+    outcomes = Counter()
+    total = len(comics)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [
+            executor.submit(_process_one_comic, comic, idx, total)
+            for idx, comic in enumerate(comics, start=1)
+        ]
+        try:
+            for future in as_completed(futures):
+                outcomes[future.result()] += 1
+        except BaseException:
+            # On Ctrl-C, stop taking new comics and only let the ones in progress finish
+            logger.warning("Interrupted - waiting for comics already in progress to finish")
+            stopping.set()
+            for future in futures:
+                future.cancel()
+            raise
     
+    logger.info(
+        "Added %d, already present %d, skipped %d, failed %d",
+        outcomes["added"], outcomes["exists"], outcomes["skipped"], outcomes["failed"]
+    )
     logger.info("Migration complete.")
 
 
+def find_comics_with_files(url: str, api_key: str, limit: int = 5, use_cache: bool = True) -> List[Dict]:
+    """
+    Find comics in Mylar that have actual files associated with them.
+    
+    The comic index is fetched once and the per-comic details for the first
+    `limit` comics are fetched concurrently.
+    
+    Args:
+        url: The Mylar API URL
+        api_key: The Mylar API key
+        limit: Maximum number of comics to check
+        use_cache: Whether to use the on-disk cache of the Mylar comic index
+        
+    Returns:
+        A list of dicts with 'title', 'id' and 'files' (each with 'issue_id',
+        'issue_number' and 'file_path') for comics that have files
+    """
+    mylar = MylarAPI(url, api_key, cache=ResponseCache(enabled=use_cache))
+    comics = list(itertools.islice(mylar.iter_comics(cmd="getIndex"), limit)) if limit > 0 else []
+    
+    comic_infos = mylar.get_comic_infos([comic["id"] for comic in comics if comic["id"]], max_workers=16)
+    
+    comics_with_files = []
+    for comic in comics:
+        comic_id = comic["id"]
+        if not comic_id:
+            continue
+        
+        files = []
+        for issue in comic_infos.get(comic_id, {}).get("issues", []):
+            location = issue.get("Location") or issue.get("location") or ""
+            status = issue.get("Status") or issue.get("status") or ""
+            if location or status in ("Downloaded", "Archived"):
+                files.append({
+                    "issue_id": issue.get("id") or issue.get("IssueID"),
+                    "issue_number": _mylar_issue_number(issue),
+                    "file_path": location
+                })
+        
+        if files:
+            comics_with_files.append({"title": comic["name"], "id": comic_id, "files": files})
+    
+    return comics_with_files
+
+
 def test_mylar_api(url: str, api_key: str, cmd: str):
     """
     Test the Mylar API with a specific command.
@@ -861,10 +1654,10 @@ def test_kapowarr_api(url: str, api_key: str, test_type: str = "auth"):
     
     elif test_type == "add_volume":
         # Test adding a volume with minimal data - only required fields
-        test_data = {
-            "comicvine_id": "145299",  # A.X.E.: Avengers
-            "root_folder_id": 2  # ID 2 is /comics-1/, ID 1 is /temp-comics/
-        }
+        test_data = VolumePayload(
+            comicvine_id="145299",  # A.X.E.: Avengers
+            root_folder_id=2  # ID 2 is /comics-1/, ID 1 is /temp-comics/
+        )
         try:
             logger.info(f"Testing add_volume with data: {test_data}")
             result = kapowarr.add_volume(test_data)
@@ -886,8 +1679,8 @@ def load_config(config_path: str = "config.json") -> dict:
         Dictionary containing the configuration
     """
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = _json_loads(f.read())
         logger.info(f"Loaded configuration from {config_path}")
         return config
     except FileNotFoundError:
@@ -950,6 +1743,15 @@ def main():
                        action="store_true",
                        default=config.get("options", {}).get("dry_run", False),
                        help="Don't actually copy files, just log what would be done")
+    parser.add_argument("--force-redownload", 
+                       action="store_true",
+                       default=config.get("options", {}).get("force_redownload", False),
+                       help="Download issues again even if the file already exists in Kapowarr's folder")
+    parser.add_argument("--no-cache", 
+                       dest="cache",
+                       action="store_false",
+                       default=config.get("options", {}).get("cache", True),
+                       help="Don't cache the Mylar comic index on disk between runs")
     
     # Mylar API options
     parser.add_argument("--test-mylar", action="store_true", 
@@ -980,6 +1782,10 @@ def main():
                        type=int, 
                        default=config.get("options", {}).get("delay", 20),
                        help="Delay between comics in seconds to respect ComicVine API rate limits")
+    parser.add_argument("--concurrency", 
+                       type=int, 
+                       default=config.get("options", {}).get("concurrency", 4),
+                       help="Number of comics to process at the same time (default: 4)")
     
     # Logging options
     parser.add_argument("--log-level", 
@@ -1006,14 +1812,16 @@ def main():
         if not args.mylar_url or not args.mylar_api_key:
             parser.error("--mylar-url and --mylar-api-key are required for --find-comics-with-files")
         
-        comics_with_files = find_comics_with_files(args.mylar_url, args.mylar_api_key, args.search_limit)
+        comics_with_files = find_comics_with_files(
+            args.mylar_url, args.mylar_api_key, args.search_limit, args.cache
+        )
         
         if comics_with_files:
             logger.info("Comics with files:")
             for comic in comics_with_files:
                 logger.info(f"- {comic['title']} (ID: {comic['id']}) has {len(comic['files'])} files")
                 for i, file_info in enumerate(comic['files']):
-                    logger.info(f"  - File {i+1}: {file_info['file_path']}")
+                    logger.info(f"  - File {i+1}: {file_info['file_path'] or 'issue #' + file_info['issue_number']}")
         else:
             logger.info("No comics with files found")
     
@@ -1039,7 +1847,10 @@ def main():
             args.resume_from,
             args.refresh_scan,
             args.mass_rename,
-            args.delay
+            args.delay,
+            args.concurrency,
+            args.force_redownload,
+            args.cache
         )
 
 